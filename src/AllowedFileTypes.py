@@ -6,9 +6,10 @@ text-based and searchable for keyword matching.
 
 Both attachment keyword checking and restricted mode use these same lists to ensure
 consistent behavior. Files must match both extension and MIME type to be accepted.
+The lists are frozensets since they are fixed and only used for membership checks.
 """
 
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     '.txt',   # Plain text files
     '.log',   # Log files
     '.csv',   # CSV data files
@@ -23,9 +24,9 @@ ALLOWED_EXTENSIONS = {
     '.cfg',   # Configuration files
     '.env',   # Environment variable files
     '.toml'   # TOML configuration files
-}
+})
 
-ALLOWED_MIME_TYPES = {
+ALLOWED_MIME_TYPES = frozenset({
     'text/plain',              # .txt, .log, .sql, .ini, .conf, .cfg, .env
     'text/csv',                # .csv
     'text/xml',                # .xml
@@ -38,4 +39,4 @@ ALLOWED_MIME_TYPES = {
     'text/x-markdown',         # .md (alternate MIME type)
     'application/toml',        # .toml
     'text/toml'                # .toml (alternate MIME type)
-}
+})
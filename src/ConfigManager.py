@@ -32,21 +32,25 @@ Configuration Flow:
         - rss_feeds list: Unique RSS feed sources, deduplicated so each is only polled once when routed to multiple destinations
 
 Deduplication strategy:
-- Keywords: Deduplicated per source via sets in _resolve_keywords()
+- Keywords: Ordered deduplication per source via dict keys in _resolve_keywords()
 - RSS feeds: Deduplicated URLs via storing as dictionary keys in _load_config()
-- Telegram channels: Deduplication via sets in get_all_channel_ids()
+- Telegram channels: Ordered deduplication in get_all_channel_ids()
 """
 
 import os
 import json
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 from pathlib import Path
 from LoggerSetup import setup_logger
+from JsonCodec import loads
 from AppTypes import APP_TYPE_TELEGRAM, APP_TYPE_DISCORD, APP_TYPE_SLACK, APP_TYPE_RSS
 
 _logger = setup_logger(__name__)
 
+# Destination types a config entry may declare
+_VALID_DESTINATION_TYPES = frozenset((APP_TYPE_DISCORD, APP_TYPE_TELEGRAM, APP_TYPE_SLACK))
+
 class ConfigManager:
     """Manages configuration from environment variables and JSON configuration files.
 
@@ -78,9 +82,12 @@ class ConfigManager:
         self.env_path = self.config_dir / ".env"
         load_dotenv(dotenv_path=self.env_path)
 
+        # Env var cache (name -> value); populated after .env is loaded, so values are final
+        self._env_cache: Dict[str, Optional[str]] = {}
+
         # Load Telegram API credentials from environment (validated later based on usage)
-        self.api_id = os.getenv('TELEGRAM_API_ID')
-        self.api_hash = os.getenv('TELEGRAM_API_HASH')
+        self.api_id = self._resolve_env_key('TELEGRAM_API_ID')
+        self.api_hash = self._resolve_env_key('TELEGRAM_API_HASH')
 
         # Create temporary working directories if they don't exist
         self.tmp_dir = self.project_root / "tmp"
@@ -91,12 +98,24 @@ class ConfigManager:
         self.telegramlog_dir = self.tmp_dir / "telegramlog"
         self.telegramlog_dir.mkdir(parents=True, exist_ok=True)
 
-        # Keyword file cache to avoid re-parsing files used by multiple destinations
+        # Keyword file cache (resolved path -> keywords) to avoid re-parsing files used by multiple destinations
         self._keyword_cache: Dict[str, List[str]] = {}
 
         # Expose CONFIG_FILE env var
         self.config_file = os.getenv('CONFIG_FILE', 'config.json')
 
+        # Cap on simultaneous Telegram attachment downloads (bounds disk and memory use under bursts)
+        max_downloads = os.getenv('MAX_CONCURRENT_DOWNLOADS', '4')
+        if not max_downloads.isdigit() or int(max_downloads) < 1:
+            raise ValueError(f"MAX_CONCURRENT_DOWNLOADS must be a positive integer, got '{max_downloads}'")
+        self.max_concurrent_downloads = int(max_downloads)
+
+        # Seconds before a Telegram attachment download is abandoned (0 disables the limit)
+        download_timeout = os.getenv('DOWNLOAD_TIMEOUT', '300')
+        if not download_timeout.isdigit():
+            raise ValueError(f"DOWNLOAD_TIMEOUT must be a non-negative integer, got '{download_timeout}'")
+        self.download_timeout = int(download_timeout)
+
         # Load and validate full configuration if requested
         if load_full_config:
             config_path = self.config_dir / self.config_file
@@ -106,12 +125,21 @@ class ConfigManager:
             # Channel ID -> Channel Name mapping
             self.channel_names: Dict[str, str] = {}
 
+            # Unique Telegram channel IDs in config order, computed once since config is immutable after load
+            self._telegram_channel_ids: Tuple[str, ...] = tuple(dict.fromkeys(
+                channel['id']
+                for destination in self.destinations
+                for channel in destination['channels']
+                if channel.get('source_type') == APP_TYPE_TELEGRAM and channel['id']
+            ))
+
             _logger.info(f"Loaded {len(self.destinations)} destinations and {len(self.rss_feeds)} RSS feeds")
         else:
             # Minimal mode:
             self.destinations = []
             self.rss_feeds = []
             self.channel_names = {}
+            self._telegram_channel_ids = ()
             _logger.info("Initialized in minimal mode (env vars and paths only)")
 
     def _validate_env_config(self):
@@ -204,8 +232,10 @@ class ConfigManager:
         if not config_file.exists():
             raise ValueError(f"Config file {config_file} not found")
 
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        # Read the whole file and close it before parsing
+        with open(config_file, 'rb') as f:
+            raw_config = f.read()
+        config = loads(raw_config)
 
         destinations: List[Dict] = []
         # Use dict for RSS deduplication: {rss_url: rss_name}
@@ -242,7 +272,7 @@ class ConfigManager:
         dest_type = destination_config.get('type')
 
         # Destination must be an expected type
-        if dest_type not in [APP_TYPE_DISCORD, APP_TYPE_TELEGRAM, APP_TYPE_SLACK]:
+        if dest_type not in _VALID_DESTINATION_TYPES:
             _logger.error(f"Invalid or missing destination type for '{name}': {dest_type}.")
             return None
 
@@ -278,6 +308,23 @@ class ConfigManager:
 
         return entry
 
+    def _resolve_env_key(self, env_key: str) -> Optional[str]:
+        """Read a single environment variable.
+
+        All credential and endpoint env vars are read through here with a direct
+        os.environ mapping lookup. Values are cached per instance, so destinations
+        sharing an env_key only look it up once.
+
+        Args:
+            env_key: Environment variable name
+
+        Returns:
+            Optional[str]: The variable's value, or None if it isn't set
+        """
+        if env_key not in self._env_cache:
+            self._env_cache[env_key] = os.environ.get(env_key)
+        return self._env_cache[env_key]
+
     def _resolve_destination_endpoint(self, destination_config: Dict, name: str, dest_type: str) -> Optional[str]:
         """Resolve destination endpoint from environment variable.
 
@@ -298,7 +345,7 @@ class ConfigManager:
             _logger.warning(f"No env_key specified for {dest_type} destination {name}")
             return None
 
-        endpoint = os.getenv(destination_config['env_key'])
+        endpoint = self._resolve_env_key(destination_config['env_key'])
         if not endpoint:
             _logger.warning(f"Missing environment variable {destination_config['env_key']} for {dest_type} destination {name}")
             return None
@@ -386,6 +433,7 @@ class ConfigManager:
             # Create a copy and resolve keywords
             processed_channel = dict(telegram_channel)
             processed_channel['keywords'] = self._resolve_keywords(telegram_channel.get('keywords'))
+            processed_channel['keywords_casefold'] = tuple(kw.casefold() for kw in processed_channel['keywords'])
             processed_channel['source_type'] = APP_TYPE_TELEGRAM
 
             if not processed_channel['keywords']:
@@ -460,6 +508,7 @@ class ConfigManager:
                 'parser': rss_entry.get('parser'),
                 'source_type': APP_TYPE_RSS
             }
+            rss_channel['keywords_casefold'] = tuple(kw.casefold() for kw in rss_channel['keywords'])
 
             rss_name = rss_entry.get('name', rss_url)
             self._validate_parser_config(
@@ -512,19 +561,24 @@ class ConfigManager:
         Raises:
             ValueError: If file doesn't exist or has invalid format
         """
-        # Check cache first
-        if filename in self._keyword_cache:
-            return self._keyword_cache[filename]
+        # Assumes path is in config directory; resolved so different spellings
+        # of the same file (e.g. 'kw.json' and './kw.json') share a cache entry
+        kw_file = (self.config_dir / filename).resolve()
+        cache_key = str(kw_file)
 
-        # Assumes path is in config directory
-        kw_file = self.config_dir / filename
+        # Check cache first
+        if cache_key in self._keyword_cache:
+            return self._keyword_cache[cache_key]
 
         if not kw_file.exists():
             raise ValueError(f"Keyword file not found: {filename}")
 
+        # Read the whole file and close it before parsing
+        with open(kw_file, 'rb') as f:
+            raw_keywords = f.read()
+
         try:
-            with open(kw_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = loads(raw_keywords)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in keyword file {filename}: {e}")
 
@@ -539,7 +593,7 @@ class ConfigManager:
             raise ValueError(f"Invalid keyword file format in {filename}: all keywords must be strings")
 
         # Cache and return
-        self._keyword_cache[filename] = keywords
+        self._keyword_cache[cache_key] = keywords
         _logger.debug(f"Loaded {len(keywords)} keywords from {filename}")
         return keywords
 
@@ -584,24 +638,20 @@ class ConfigManager:
                 raise ValueError("All keywords in 'inline' must be strings")
             keywords.extend(inline)
 
-        # Deduplicate keywords
-        keywords = list(set(keywords))
+        # Deduplicate keywords, keeping the order they were configured in
+        keywords = list(dict.fromkeys(keywords))
 
         return keywords
 
-    def get_all_channel_ids(self) -> Set[str]:
+    def get_all_channel_ids(self) -> Tuple[str, ...]:
         """Get all unique Telegram channel IDs from destination config.
 
         Collects all Telegram channel IDs across all destinations, excluding RSS feeds.
         Uses the 'source_type' field to differentiate between Telegram channels
-        and RSS pseudo-channels.
+        and RSS pseudo-channels. Deduplicated once in __init__, keeping the order
+        channels first appear in the config so startup resolution is deterministic.
 
         Returns:
-            Set[str]: Unique Telegram channel IDs
+            Tuple[str, ...]: Unique Telegram channel IDs
         """
-        telegram_channel_ids = set()
-        for destination in self.destinations:
-            for channel in destination['channels']:
-                if channel.get('source_type') == APP_TYPE_TELEGRAM:
-                    telegram_channel_ids.add(channel['id'])
-        return telegram_channel_ids
+        return self._telegram_channel_ids
@@ -12,12 +12,30 @@ Current Implementations:
 """
 import time
 import math
+import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC as AbstractBaseClass, abstractmethod
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import Iterator, List, Dict, Optional
 from LoggerSetup import setup_logger
 
 _logger = setup_logger(__name__)
 
+# Display format for message timestamps across all destinations
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+
+def format_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp for display with TIMESTAMP_FORMAT.
+
+    Args:
+        timestamp: Message or reply timestamp
+
+    Returns:
+        str: Formatted timestamp, e.g. "2025-01-31 12:00:00 UTC"
+    """
+    return timestamp.strftime(TIMESTAMP_FORMAT)
+
 
 class DestinationHandler(AbstractBaseClass):
     """Abstract base class for destination handlers.
@@ -30,6 +48,9 @@ class DestinationHandler(AbstractBaseClass):
     Subclasses must implement platform-specific send and format operations.
     """
 
+    # Keep-alive connections per host for HTTP based handlers; sized for concurrent worker-thread posts
+    _HTTP_POOL_MAXSIZE = 20
+
     def __init__(self):
         """Initialize with empty rate limit tracking."""
         # Track rate limits per destination: destination_id -> expiry timestamp
@@ -62,6 +83,22 @@ class DestinationHandler(AbstractBaseClass):
         """
         pass
 
+    @classmethod
+    def _create_http_session(cls) -> requests.Session:
+        """Create a requests session with a connection pool sized for concurrent posts.
+
+        requests keeps only 10 connections per host by default, so extra connections
+        opened by concurrent posts would be discarded instead of reused.
+
+        Returns:
+            requests.Session: Session with HTTPS/HTTP adapters of _HTTP_POOL_MAXSIZE connections
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=cls._HTTP_POOL_MAXSIZE, pool_maxsize=cls._HTTP_POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def is_rate_limited(self, destination_id) -> bool:
         """Check if destination is currently rate limited without waiting.
 
@@ -103,28 +140,40 @@ class DestinationHandler(AbstractBaseClass):
         Raises:
             ValueError: If max_length isn't a positive value
         """
+        return list(self._iter_chunks(text, max_length))
+
+    def _iter_chunks(self, text: str, max_length: int) -> Iterator[str]:
+        """Lazily yield the same chunks as _chunk_text.
+
+        For callers that send chunks one at a time and don't need the count up front.
+
+        Raises:
+            ValueError: If max_length isn't a positive value (on first iteration)
+        """
         if max_length < 0:
             raise ValueError("max_length must be positive")
         
         if len(text) <= max_length:
-            return [text]
-
-        chunks = []
-        while text:
-            if len(text) <= max_length:
-                chunks.append(text)
-                break
-
-            split_point = text.rfind('\n', 0, max_length)
+            yield text
+            return
+
+        # Walk the text by index so only the chunks themselves are copied
+        start = 0
+        text_length = len(text)
+        while text_length - start > max_length:
+            split_point = text.rfind('\n', start, start + max_length)
             if split_point == -1:
                 # No newline found, perform hard split at max_length
-                split_point = max_length
+                split_point = start + max_length
 
-            chunks.append(text[:split_point])
-            # Remove leading newlines
-            text = text[split_point:].lstrip('\n')
+            yield text[start:split_point]
+            # Skip leading newlines of the next chunk
+            start = split_point
+            while start < text_length and text[start] == '\n':
+                start += 1
 
-        return chunks
+        if start < text_length:
+            yield text[start:]
 
     @abstractmethod
     async def send_message(self, content: str, destination_id, media_path: Optional[str] = None) -> bool:
@@ -9,14 +9,17 @@ Discord API Details:
     - Rate limit response: 429 status code with retry_after in seconds
     - Success status codes: 200, 204
 """
+import asyncio
 import os
 import json
 import time
+import random
 import requests
 from typing import Optional, Dict
 from LoggerSetup import setup_logger
 from MessageData import MessageData
-from DestinationHandler import DestinationHandler
+from DestinationHandler import DestinationHandler, format_timestamp
+from JsonCodec import dumps, JSON_HEADERS
 
 _logger = setup_logger(__name__)
 
@@ -33,8 +36,20 @@ class DiscordHandler(DestinationHandler):
     _FILE_SIZE_LIMIT = 25 * 1024 * 1024  # 25MB for Discord free tier
     MAX_MSG_LENGTH = 2000
 
+    # Serialized start of every text payload: {"username":...,"avatar_url":...,"content":
+    _PAYLOAD_PREFIX = dumps({"username": _USERNAME, "avatar_url": _AVATAR_URL})[:-1] + b',"content":'
+
+    # Longest pause before a post when a webhook's rate limit bucket is exhausted;
+    # longer resets are left to the 429 handling and retry queue
+    _MAX_BUCKET_WAIT = 5.0  # seconds
+    _BUCKET_WAIT_JITTER = 0.25  # seconds
+
     def __init__(self):
         super().__init__()
+        # Shared session keeps the webhook connection alive between chunks and messages
+        self._session = self._create_http_session()
+        # Exhausted rate limit buckets: webhook_url -> timestamp the bucket resets
+        self._bucket_resets: Dict[str, float] = {}
 
     @property
     def file_size_limit(self) -> int:
@@ -61,44 +76,23 @@ class DiscordHandler(DestinationHandler):
             if self.is_rate_limited(webhook_url):
                 wait_until = self._rate_limits[webhook_url]
                 wait_time = wait_until - time.time()
-                _logger.info(f"Webhook {webhook_url[:50]}... is rate limited for {wait_time:.1f}s more, skipping send")
+                _logger.info("Webhook %s... is rate limited for %.1fs more, skipping send", webhook_url[:50], wait_time)
                 return False
 
             chunks = self._chunk_text(content, self.MAX_MSG_LENGTH)
             chunks_sent = 0
 
-            if attachment_path and os.path.exists(attachment_path):
-                with open(attachment_path, 'rb') as f:
-                    files = {'file': f}
-                    data = {
-                        'username': self._USERNAME,
-                        'avatar_url': self._AVATAR_URL,
-                        'content': chunks[0]
-                    }
-                    response = requests.post(webhook_url, files=files, data=data, timeout=15)
-
-                    if response.status_code == 429:
-                        self._handle_rate_limit(webhook_url, response)
-                        return False
-                    elif response.status_code not in [200, 204]:
-                        body = (response.text or "")[:200]
-                        _logger.error(
-                            f"Unsuccessful status code from Discord webhook (sent media): "
-                            f"status={response.status_code}, body={body}"
-                        )
-                        return False
-                    chunks_sent = 1  # First chunk sent with media
-
-            # Send remaining chunks as text-only messages
-            for chunk_index, chunk in enumerate(chunks[chunks_sent:], start=chunks_sent + 1):
-                payload = {
-                    "username": self._USERNAME,
-                    "avatar_url": self._AVATAR_URL,
-                    "content": chunk
+            if attachment_path and await asyncio.to_thread(os.path.exists, attachment_path):
+                data = {
+                    'username': self._USERNAME,
+                    'avatar_url': self._AVATAR_URL,
+                    'content': chunks[0]
                 }
-
-                # Blocks until compelete, helps ensure msg chunk order
-                response = requests.post(webhook_url, json=payload, timeout=5)
+                # File read and upload both happen in a worker thread
+                if not await self._wait_for_bucket(webhook_url):
+                    return False
+                response = await asyncio.to_thread(self._post_file, webhook_url, attachment_path, data)
+                self._track_bucket(webhook_url, response)
 
                 if response.status_code == 429:
                     self._handle_rate_limit(webhook_url, response)
@@ -106,10 +100,16 @@ class DiscordHandler(DestinationHandler):
                 elif response.status_code not in [200, 204]:
                     body = (response.text or "")[:200]
                     _logger.error(
-                        f"Unsuccessful status code from Discord webhook (chunk {chunk_index}/{len(chunks)}): "
+                        f"Unsuccessful status code from Discord webhook (sent media): "
                         f"status={response.status_code}, body={body}"
                     )
                     return False
+                chunks_sent = 1  # First chunk sent with media
+
+            # Send remaining chunks as text-only messages, awaited in order to keep msg chunk order
+            for chunk_index, chunk in enumerate(chunks[chunks_sent:], start=chunks_sent + 1):
+                if not await self._post_chunk(webhook_url, chunk, chunk_index, len(chunks)):
+                    return False
 
             return True
 
@@ -117,11 +117,120 @@ class DiscordHandler(DestinationHandler):
             _logger.error(f"Discord send failed: {e}")
             return False
 
+    def _post_file(self, webhook_url: str, attachment_path: str, data: Dict) -> requests.Response:
+        """Upload a file with form fields to a Discord webhook (blocking).
+
+        Opens the file and streams it as multipart form data on the shared session.
+        Meant to be run in a worker thread via asyncio.to_thread.
+
+        Args:
+            webhook_url: Discord webhook URL
+            attachment_path: Path to the file to upload
+            data: Form fields sent alongside the file
+
+        Returns:
+            requests.Response: Webhook response
+        """
+        with open(attachment_path, 'rb') as f:
+            return self._session.post(webhook_url, files={'file': f}, data=data, timeout=15)
+
+    async def _post_chunk(self, webhook_url: str, chunk: str, chunk_index: int, chunk_count: int) -> bool:
+        """Post a single text chunk to a Discord webhook.
+
+        Args:
+            webhook_url: Discord webhook URL
+            chunk: Chunk text to send
+            chunk_index: 1-based position of the chunk, for logging
+            chunk_count: Total number of chunks in the message, for logging
+
+        Returns:
+            bool: True if the chunk was accepted, False on rate limit or error status
+        """
+        # Only the chunk text needs encoding; the constant fields are pre-serialized
+        body = self._PAYLOAD_PREFIX + dumps(chunk) + b'}'
+
+        # The request runs in a worker thread so the event loop stays free
+        if not await self._wait_for_bucket(webhook_url):
+            return False
+        response = await asyncio.to_thread(
+            self._session.post, webhook_url, data=body, headers=JSON_HEADERS, timeout=5
+        )
+        self._track_bucket(webhook_url, response)
+
+        if response.status_code == 429:
+            self._handle_rate_limit(webhook_url, response)
+            return False
+        elif response.status_code not in [200, 204]:
+            body = (response.text or "")[:200]
+            _logger.error(
+                f"Unsuccessful status code from Discord webhook (chunk {chunk_index}/{chunk_count}): "
+                f"status={response.status_code}, body={body}"
+            )
+            return False
+
+        return True
+
+    def _track_bucket(self, webhook_url: str, response: requests.Response) -> None:
+        """Record when an exhausted rate limit bucket resets.
+
+        Discord reports the remaining requests in the current window with
+        X-RateLimit-Remaining and the seconds until it resets with X-RateLimit-Reset-After.
+        The record is cleared once a later response shows requests remaining again.
+
+        Args:
+            webhook_url: Webhook URL the response came from
+            response: HTTP response from Discord API
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        if remaining != '0':
+            self._bucket_resets.pop(webhook_url, None)
+            return
+
+        try:
+            reset_after = float(response.headers.get('X-RateLimit-Reset-After', ''))
+        except ValueError:
+            return
+        self._bucket_resets[webhook_url] = time.time() + reset_after
+
+    async def _wait_for_bucket(self, webhook_url: str) -> bool:
+        """Pause until an exhausted rate limit bucket resets, if the reset is near.
+
+        Waiting out a short reset avoids a request that would be rejected with 429.
+        A small random jitter keeps concurrent senders from all retrying at once.
+        The reset record is only read here, so every concurrent sender waits for it.
+        A reset further away than _MAX_BUCKET_WAIT is stored as a rate limit instead,
+        so the send is skipped and left to is_rate_limited and the retry queue.
+
+        Args:
+            webhook_url: Webhook URL about to be posted to
+
+        Returns:
+            bool: True if the post can go ahead, False if the webhook is now rate limited
+        """
+        reset_at = self._bucket_resets.get(webhook_url)
+        if reset_at is None:
+            return True
+
+        wait_time = reset_at - time.time()
+        if wait_time <= 0:
+            # Bucket has already reset, clean up
+            self._bucket_resets.pop(webhook_url, None)
+        elif wait_time <= self._MAX_BUCKET_WAIT:
+            await asyncio.sleep(wait_time + random.uniform(0, self._BUCKET_WAIT_JITTER))
+        else:
+            # Posting now would only earn a 429
+            self._store_rate_limit(webhook_url, wait_time)
+            return False
+        return True
+
     def _extract_retry_after(self, response: requests.Response) -> Optional[float]:
         """Extract retry_after value from Discord 429 rate limit response.
 
         Discord returns rate limit info in JSON body with 'retry_after' field
-        specifying seconds to wait.
+        specifying seconds to wait. Falls back to the Retry-After header if the
+        body doesn't contain it.
 
         Args:
             response: 429 HTTP response from Discord API
@@ -131,9 +240,15 @@ class DiscordHandler(DestinationHandler):
         """
         try:
             body = response.json()
-            return body.get('retry_after', 1.0)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            retry_after = body.get('retry_after')
+            if retry_after is not None:
+                return float(retry_after)
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError) as e:
             _logger.warning(f"Rate limited (429) but couldn't parse retry_after: {e}")
+
+        try:
+            return float(response.headers['Retry-After'])
+        except (KeyError, TypeError, ValueError):
             return None
 
     def _handle_rate_limit(self, webhook_url: str, response: requests.Response) -> None:
@@ -176,7 +291,7 @@ class DiscordHandler(DestinationHandler):
         lines = [
             f"**New message from:** {message_data.channel_name}",
             f"**By:** {message_data.username}",
-            f"**Time:** {message_data.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+            f"**Time:** {format_timestamp(message_data.timestamp)}"
         ]
 
         if 'src_url_defanged' in message_data.metadata:
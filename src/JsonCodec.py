@@ -0,0 +1,52 @@
+"""
+JsonCodec - JSON encoding and decoding with an optional fast backend
+
+This module uses orjson when it is installed and falls back to the standard
+library json module otherwise. Both backends produce UTF-8 bytes from dumps()
+and accept str or bytes in loads(), so callers don't need to know which one is active.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching json.JSONDecodeError for either backend.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except Exception:
+    _ORJSON_AVAILABLE = False
+
+# Header to send alongside a dumps() body in place of requests' json= argument
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON serializable object
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Any: Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,12 +5,16 @@ This module defines the MessageData dataclass which serves as a unified represen
 of messages from different sources (e.g., Telegram, RSS). It provides a common interface
 for message routing, processing, and forwarding operations.
 """
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Literal, Any
 from datetime import datetime
 from AppTypes import APP_TYPE_TELEGRAM, APP_TYPE_RSS
 
-@dataclass
+# __slots__ drops the per-instance __dict__; dataclass(slots=...) requires Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class MessageData:
     """Generic container for message information from any source.
 
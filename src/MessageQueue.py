@@ -9,6 +9,10 @@ Retry Strategy:
     Attempt 2: Wait 10 seconds
     Attempt 3: Wait 20 seconds
     After 3 failures: Message is dropped and logged
+
+Batching:
+    Text-only Discord/Slack retries that are due for the same webhook are joined
+    into a single post (up to BATCH_MAX_ITEMS and the platform message length)
 """
 import time
 import asyncio
@@ -51,6 +55,15 @@ class MessageQueue:
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 5  # seconds
 
+    BATCH_MAX_ITEMS = 10
+    BATCH_SEPARATOR = "\n\n"
+
+    # Webhook destinations whose text-only retries can be batched: type -> webhook URL key
+    _BATCHABLE_WEBHOOK_KEYS = {
+        APP_TYPE_DISCORD: 'discord_webhook_url',
+        APP_TYPE_SLACK: 'slack_webhook_url',
+    }
+
     def __init__(self, metrics=None):
         """Initialize empty retry queue.
 
@@ -74,7 +87,7 @@ class MessageQueue:
             next_retry_time=time.time() + self.INITIAL_BACKOFF
         )
         self._queue.append(retry_item)
-        _logger.info(f"Enqueued message for retry: {reason} (destination: {destination['name']})")
+        _logger.info("Enqueued message for retry: %s (destination: %s)", reason, destination['name'])
 
     async def process_queue(self, watchtower: 'Watchtower') -> None:
         """Background task that continuously processes retry queue.
@@ -89,9 +102,14 @@ class MessageQueue:
 
         while True:
             now = time.time()
+            # Items already sent as part of a batch during this pass
+            handled = set()
 
             # Iterate over copy to safely remove items during iteration
             for retry_item in self._queue[:]:
+                if id(retry_item) in handled:
+                    continue
+
                 if now >= retry_item.next_retry_time:
                     # Check if destination is still rate limited
                     dest = retry_item.destination
@@ -117,43 +135,111 @@ class MessageQueue:
                         remaining = rate_limit_expiry - now
                         retry_item.next_retry_time = rate_limit_expiry
                         _logger.info(
-                            f"Destination {dest['name']} still rate limited for {remaining:.1f}s, "
-                            f"will retry when rate limit expires"
+                            "Destination %s still rate limited for %.1fs, will retry when rate limit expires",
+                            dest['name'], remaining
                         )
                         continue  # Skip this item without counting as retry attempt
 
-                    # Not rate limited,attempt retry
-                    success = await self._retry_send(retry_item, watchtower)
-
-                    if success:
-                        self._queue.remove(retry_item)
-                        if self._metrics:
-                            self._metrics.increment("messages_retry_succeeded")
-                        _logger.info(
-                            f"Retry succeeded after {retry_item.attempt_count + 1} "
-                            f"attempt(s) for {retry_item.destination['name']}"
-                        )
-                    # Max retries reached (0, 1, 2 = 3 attempts)
-                    elif retry_item.attempt_count >= self.MAX_RETRIES - 1:
-                        self._queue.remove(retry_item)
-                        if self._metrics:
-                            self._metrics.increment("messages_retry_failed")
-                        _logger.error(
-                            f"Message dropped after {self.MAX_RETRIES} "
-                            f"failed attempts to {retry_item.destination['name']}"
+                    # Not rate limited, attempt retry (joined with other due text-only items if possible)
+                    batch = self._collect_batch(retry_item, now, watchtower)
+                    if len(batch) > 1:
+                        combined = RetryItem(
+                            destination=dest,
+                            formatted_content=self.BATCH_SEPARATOR.join(item.formatted_content for item in batch),
+                            attachment_path=None
                         )
-                    # Exponential backoff: 5s, 10s, 20s
+                        _logger.info("Retrying %d queued messages as one post to %s", len(batch), dest['name'])
+                        success = await self._retry_send(combined, watchtower)
                     else:
-                        retry_item.attempt_count += 1
-                        backoff = self.INITIAL_BACKOFF * (2 ** retry_item.attempt_count)
-                        retry_item.next_retry_time = now + backoff
-                        _logger.info(
-                            f"Retry attempt {retry_item.attempt_count + 1}/{self.MAX_RETRIES} "
-                            f"failed for {retry_item.destination['name']}, next retry in {backoff}s"
-                        )
+                        success = await self._retry_send(retry_item, watchtower)
+
+                    for item in batch:
+                        handled.add(id(item))
+                        self._record_attempt(item, success, now)
 
             await asyncio.sleep(1)  # Check queue every second
 
+    def _collect_batch(self, first: RetryItem, now: float, watchtower: 'Watchtower') -> List[RetryItem]:
+        """Collect due text-only retries for the same webhook to send together.
+
+        Only Discord and Slack items without attachments are batched. Items for the same
+        webhook are taken in queue order until BATCH_MAX_ITEMS is reached or an item can't
+        join (not yet due, has an attachment, or would push the joined text past the
+        platform's single message length).
+
+        Args:
+            first: Due retry item currently being processed
+            now: Current Unix timestamp
+            watchtower: Watchtower instance providing access to destination handlers
+
+        Returns:
+            List[RetryItem]: Items to send in one post, starting with first
+        """
+        dest = first.destination
+        webhook_key = self._BATCHABLE_WEBHOOK_KEYS.get(dest['type'])
+        if not webhook_key or first.attachment_path:
+            return [first]
+
+        if dest['type'] == APP_TYPE_DISCORD:
+            max_length = watchtower.discord.MAX_MSG_LENGTH
+        else:
+            max_length = watchtower.slack.MAX_MSG_LENGTH
+
+        batch = [first]
+        total_length = len(first.formatted_content)
+        first_index = next(i for i, item in enumerate(self._queue) if item is first)
+
+        for item in self._queue[first_index + 1:]:
+            if len(batch) >= self.BATCH_MAX_ITEMS:
+                break
+            if item.destination['type'] != dest['type'] or item.destination.get(webhook_key) != dest[webhook_key]:
+                continue
+
+            # Stop at the first item for this webhook that can't join, so posts stay in queue order
+            new_length = total_length + len(self.BATCH_SEPARATOR) + len(item.formatted_content)
+            if now < item.next_retry_time or item.attachment_path or new_length > max_length:
+                break
+
+            batch.append(item)
+            total_length = new_length
+
+        return batch
+
+    def _record_attempt(self, retry_item: RetryItem, success: bool, now: float) -> None:
+        """Remove, drop, or reschedule a retry item based on the outcome of an attempt.
+
+        Args:
+            retry_item: Item that was just retried
+            success: Whether the retry succeeded
+            now: Unix timestamp the attempt was made at
+        """
+        if success:
+            self._queue.remove(retry_item)
+            if self._metrics:
+                self._metrics.increment("messages_retry_succeeded")
+            _logger.info(
+                "Retry succeeded after %d attempt(s) for %s",
+                retry_item.attempt_count + 1, retry_item.destination['name']
+            )
+        # Max retries reached (0, 1, 2 = 3 attempts)
+        elif retry_item.attempt_count >= self.MAX_RETRIES - 1:
+            self._queue.remove(retry_item)
+            if self._metrics:
+                self._metrics.increment("messages_retry_failed")
+            _logger.error(
+                f"Message dropped after {self.MAX_RETRIES} "
+                f"failed attempts to {retry_item.destination['name']}"
+            )
+        # Exponential backoff: 5s, 10s, 20s
+        else:
+            retry_item.attempt_count += 1
+            backoff = self.INITIAL_BACKOFF * (2 ** retry_item.attempt_count)
+            retry_item.next_retry_time = now + backoff
+            _logger.info(
+                "Retry attempt %d/%d failed for %s, next retry in %ss",
+                retry_item.attempt_count + 1, self.MAX_RETRIES, retry_item.destination['name'], backoff
+            )
+
     async def _retry_send(self, retry_item: RetryItem, watchtower: 'Watchtower') -> bool:
         """Attempt to resend a message.
 
@@ -212,4 +298,4 @@ class MessageQueue:
         size = len(self._queue)
         self._queue.clear()
         if size > 0:
-            _logger.info(f"Cleared {size} items from retry queue")
+            _logger.info("Cleared %d items from retry queue", size)
@@ -7,8 +7,9 @@ This module handles:
 - Parsing: Trimming lines from message text per destination
 - Channel Matching: Flexible matching of channel IDs (username, numeric ID, RSS URL)
 """
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
+import logging
 import mimetypes
 from LoggerSetup import setup_logger
 from ConfigManager import ConfigManager
@@ -38,6 +39,13 @@ class MessageRouter:
         self.config = config
         self.channel_mappings: Dict[str, str] = {}
 
+        # Destinations are fixed for the process lifetime, so index them once:
+        # configured channel ID -> [(destination index, channel index), ...]
+        self._route_index: Dict[str, List[Tuple[int, int]]] = {}
+        for dest_index, destination in enumerate(self.config.destinations):
+            for channel_index, dst_channel in enumerate(destination.get('channels', [])):
+                self._route_index.setdefault(dst_channel['id'], []).append((dest_index, channel_index))
+
     def is_channel_restricted(self, src_channel_id: str, src_channel_name: str, src_type: str) -> bool:
         """Check if any destination has restricted mode enabled for this channel.
 
@@ -52,12 +60,11 @@ class MessageRouter:
         Returns:
             bool: True if any destination monitoring this channel has restricted_mode=True
         """
-        for destination in self.config.destinations:
-            for dst_channel in destination['channels']:
-                if self._channel_matches(src_channel_id, src_channel_name, src_type, dst_channel['id']):
-                    if dst_channel.get('restricted_mode', False):
-                        return True
-        return False
+        # Every matching channel config counts, including a second entry for the same channel in one destination
+        return any(
+            dst_channel.get('restricted_mode', False)
+            for dst_channel in self._iter_channel_configs(src_channel_id, src_channel_name, src_type)
+        )
 
     def is_ocr_enabled_for_channel(self, src_channel_id: str, src_channel_name: str, src_type: str) -> bool:
         """Check if any destination has OCR enabled for this channel.
@@ -72,12 +79,11 @@ class MessageRouter:
         Returns:
             bool: True if any destination monitoring this channel has ocr=True
         """
-        for destination in self.config.destinations:
-            for dst_channel in destination['channels']:
-                if self._channel_matches(src_channel_id, src_channel_name, src_type, dst_channel['id']):
-                    if dst_channel.get('ocr', False):
-                        return True
-        return False
+        # Every matching channel config counts, including a second entry for the same channel in one destination
+        return any(
+            dst_channel.get('ocr', False)
+            for dst_channel in self._iter_channel_configs(src_channel_id, src_channel_name, src_type)
+        )
 
     def add_channel_mapping(self, config_id: str, actual_id: str) -> None:
         """Store mapping between configured ID and actual channel ID.
@@ -113,39 +119,29 @@ class MessageRouter:
         """
         destinations: List[Dict] = []
 
-        # Check if this channel is configured anywhere
-        channel_is_configured = False
-        for destination in self.config.destinations:
-            for dst_channel in destination.get('channels', []):
-                if self._channel_matches(message_data.channel_id, message_data.channel_name, message_data.source_type, dst_channel['id']):
-                    channel_is_configured = True
-                    break
-            if channel_is_configured:
-                break
+        # Destinations monitoring this channel, paired with their channel configuration
+        channel_configs = self._find_channel_configs(message_data.channel_id, message_data.channel_name, message_data.source_type)
 
         # Early exit if channel is not monitored by any destination
-        if not channel_is_configured:
-            _logger.info(f"No configured matches for channel {message_data.channel_name} ({message_data.channel_id})")
+        if not channel_configs:
+            _logger.info("No configured matches for channel %s (%s)", message_data.channel_name, message_data.channel_id)
             return destinations
 
-        # Collect all matching destinations
-        for destination in self.config.destinations:
-            # Find the channel configuration for this destination (if it monitors this channel)
-            dst_channel_config = None
-            for dst_channel in destination['channels']:
-                if self._channel_matches(message_data.channel_id, message_data.channel_name, message_data.source_type, dst_channel['id']):
-                    dst_channel_config = dst_channel
-                    break
-
-            # Skip if this destination doesn't monitor this channel
-            if not dst_channel_config:
-                continue
+        # Case-fold the message text once for all destinations; the text + OCR
+        # combination is folded on first use by an OCR enabled channel
+        text_folded = (message_data.text or "").casefold()
+        text_with_ocr_folded = None
 
+        # Collect all matching destinations
+        for destination, dst_channel_config in channel_configs:
             # Build searchable text: message text + OCR text (if OCR enabled and available)
-            searchable_text = message_data.text or ""
+            searchable_folded = text_folded
             if dst_channel_config.get('ocr', False) and message_data.ocr_raw:
                 # Combine message text and OCR text for keyword matching
-                searchable_text = f"{searchable_text}\n{message_data.ocr_raw}" if searchable_text else message_data.ocr_raw
+                if text_with_ocr_folded is None:
+                    ocr_folded = message_data.ocr_raw.casefold()
+                    text_with_ocr_folded = f"{text_folded}\n{ocr_folded}" if text_folded else ocr_folded
+                searchable_folded = text_with_ocr_folded
 
             # Check text-based attachments
             keywords = dst_channel_config.get('keywords', [])
@@ -167,8 +163,10 @@ class MessageRouter:
                 matched = []
 
                 # Check text content (message text + OCR if enabled) for keyword matches
-                if searchable_text:
-                    text_matched = [kw for kw in keywords if kw.lower() in searchable_text.lower()]
+                if searchable_folded:
+                    # Folded keywords are precomputed by ConfigManager alongside 'keywords'
+                    folded_keywords = dst_channel_config.get('keywords_casefold') or tuple(kw.casefold() for kw in keywords)
+                    text_matched = [kw for kw, kw_folded in zip(keywords, folded_keywords) if kw_folded in searchable_folded]
                     matched.extend(text_matched)
 
                 # Check attachment for matches separately due to file streaming
@@ -313,15 +311,15 @@ class MessageRouter:
         # Check file extension
         file_extension = path.suffix.lower()
         if file_extension not in ALLOWED_EXTENSIONS:
-            _logger.info(f"Skipping attachment with disallowed extension: {path.name}")
+            _logger.info("Skipping attachment with disallowed extension: %s", path.name)
             return None
 
         # Check MIME type
         mime_type, _ = mimetypes.guess_type(str(path))
         if not mime_type or mime_type not in ALLOWED_MIME_TYPES:
             _logger.info(
-                f"Skipping attachment with disallowed MIME type: "
-                f"{path.name} (extension={file_extension}, mime={mime_type})"
+                "Skipping attachment with disallowed MIME type: %s (extension=%s, mime=%s)",
+                path.name, file_extension, mime_type
             )
             return None
 
@@ -337,43 +335,48 @@ class MessageRouter:
 
         if file_size > 100 * 1024 * 1024:  # Log if > 100MB
             _logger.info(
-                f"Streaming {file_size / (1024*1024):.1f}MB attachment for keyword checking: {path.name}"
+                "Streaming %.1fMB attachment for keyword checking: %s",
+                file_size / (1024*1024), path.name
             )
 
         # Stream file line-by-line for keyword matching
         try:
-            matched_lines = []
+            # Dict keeps first-seen line order with O(1) duplicate checks
+            matched_lines = {}
             matched_keywords = set()
             total_lines = 0
             has_matches = False
 
+            # Case-fold keywords once rather than per line
+            folded_keywords = [(kw, kw.casefold()) for kw in keywords]
+
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
                 for line in f:
                     total_lines += 1
                     line_stripped = line.rstrip('\n\r')
 
                     # Check for keyword matches
-                    if keywords:
-                        line_lower = line_stripped.lower()
-                        for kw in keywords:
-                            if kw.lower() in line_lower:
+                    if folded_keywords:
+                        line_folded = line_stripped.casefold()
+                        for kw, kw_folded in folded_keywords:
+                            if kw_folded in line_folded:
                                 matched_keywords.add(kw)
-                                if line_stripped not in matched_lines:
-                                    matched_lines.append(line_stripped)
+                                matched_lines.setdefault(line_stripped)
                                 has_matches = True
 
             result = {
                 'has_matches': has_matches,
                 'matched_keywords': list(matched_keywords),
-                'matched_lines': matched_lines,
+                'matched_lines': list(matched_lines),
                 'total_lines': total_lines,
                 'file_size': file_size
             }
 
-            _logger.debug(
-                f"Scanned {total_lines} lines from {path.name}, "
-                f"found {len(matched_lines)} matches with keywords: {', '.join(matched_keywords)}"
-            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Scanned %d lines from %s, found %d matches with keywords: %s",
+                    total_lines, path.name, len(matched_lines), ', '.join(matched_keywords)
+                )
             return result
 
         except Exception as e:
@@ -414,6 +417,75 @@ class MessageRouter:
         
         return base
 
+    def _find_channel_configs(self, src_channel_id: str, src_channel_name: str, src_type: str) -> List[Tuple[Dict, Dict]]:
+        """Look up the destinations monitoring a source channel using the route index.
+
+        Produces the same matches as checking _channel_matches() against every configured
+        channel, but only probes the handful of config IDs the source could appear as.
+
+        Args:
+            src_channel_id: Actual channel identifier from message source
+            src_channel_name: Source channel's display name
+            src_type: Platform (RSS, Telegram, etc.)
+
+        Returns:
+            List[Tuple[Dict, Dict]]: (destination, channel config) pairs in configuration order,
+                using the first matching channel config of each destination
+        """
+        # destination index -> lowest matching channel index
+        first_match: Dict[int, int] = {}
+        for candidate_id in self._candidate_config_ids(src_channel_id, src_channel_name, src_type):
+            for dest_index, channel_index in self._route_index.get(candidate_id, ()):
+                if channel_index < first_match.get(dest_index, channel_index + 1):
+                    first_match[dest_index] = channel_index
+
+        all_destinations = self.config.destinations
+        return [
+            (all_destinations[dest_index], all_destinations[dest_index]['channels'][channel_index])
+            for dest_index, channel_index in sorted(first_match.items())
+        ]
+
+    def _iter_channel_configs(self, src_channel_id: str, src_channel_name: str, src_type: str) -> Iterator[Dict]:
+        """Yield every configured channel matching a source channel, across all destinations.
+
+        Unlike _find_channel_configs(), a destination listing the same channel more than once
+        (e.g. by @username and by -100 ID) yields each of those channel configs.
+
+        Args:
+            src_channel_id: Actual channel identifier from message source
+            src_channel_name: Source channel's display name
+            src_type: Platform (RSS, Telegram, etc.)
+
+        Yields:
+            Dict: Matching channel configs (a config may be yielded more than once)
+        """
+        all_destinations = self.config.destinations
+        for candidate_id in self._candidate_config_ids(src_channel_id, src_channel_name, src_type):
+            for dest_index, channel_index in self._route_index.get(candidate_id, ()):
+                yield all_destinations[dest_index]['channels'][channel_index]
+
+    @staticmethod
+    def _candidate_config_ids(src_channel_id: str, src_channel_name: str, src_type: str) -> List[str]:
+        """List the configured IDs a source channel can match, for route index lookups.
+
+        Args:
+            src_channel_id: Actual channel identifier from message source
+            src_channel_name: Source channel's display name
+            src_type: Platform (RSS, Telegram, etc.)
+
+        Returns:
+            List[str]: Config IDs to look up (empty for unsupported source types)
+        """
+        if src_type == APP_TYPE_RSS:
+            return [src_channel_id]
+        if src_type == APP_TYPE_TELEGRAM:
+            # Username, exact ID, and the ID with or without the -100 supergroup prefix
+            candidate_ids = [src_channel_id, src_channel_name, f"-100{src_channel_id}"]
+            if src_channel_id.startswith("-100") and src_channel_id[4:].isdigit():
+                candidate_ids.append(src_channel_id[4:])
+            return candidate_ids
+        return []
+
     def _channel_matches(self, src_channel_id: str, src_channel_name: str, src_type: str, dst_config_id: str) -> bool:
         """Check if the source channel matches one a destination is monitoring.
 
@@ -9,12 +9,14 @@ Slack API Details:
     - Rate limit response: 429 status code with Retry-After header in seconds
     - Success status codes: 200, 204
 """
+import asyncio
 import time
 import requests
 from typing import Optional, Dict
 from LoggerSetup import setup_logger
 from MessageData import MessageData
-from DestinationHandler import DestinationHandler
+from DestinationHandler import DestinationHandler, format_timestamp
+from JsonCodec import dumps, JSON_HEADERS
 
 _logger = setup_logger(__name__)
 
@@ -33,6 +35,8 @@ class SlackHandler(DestinationHandler):
 
     def __init__(self):
         super().__init__()
+        # Shared session keeps the webhook connection alive between chunks and messages
+        self._session = self._create_http_session()
 
     @property
     def file_size_limit(self) -> int:
@@ -60,7 +64,7 @@ class SlackHandler(DestinationHandler):
             if self.is_rate_limited(webhook_url):
                 wait_until = self._rate_limits[webhook_url]
                 wait_time = wait_until - time.time()
-                _logger.info(f"Webhook {webhook_url[:50]}... is rate limited for {wait_time:.1f}s more, skipping send")
+                _logger.info("Webhook %s... is rate limited for %.1fs more, skipping send", webhook_url[:50], wait_time)
                 return False
 
             # Add attachment warning if attachment was provided
@@ -75,8 +79,10 @@ class SlackHandler(DestinationHandler):
                     "text": chunk
                 }
 
-                # Blocks until complete, helps ensure msg chunk order
-                response = requests.post(webhook_url, json=payload, timeout=5)
+                # Awaited in order to keep msg chunk order; the request runs in a worker thread
+                response = await asyncio.to_thread(
+                    self._session.post, webhook_url, data=dumps(payload), headers=JSON_HEADERS, timeout=5
+                )
 
                 if response.status_code == 429:
                     self._handle_rate_limit(webhook_url, response)
@@ -156,7 +162,7 @@ class SlackHandler(DestinationHandler):
         lines = [
             f"*New message from:* {message_data.channel_name}",
             f"*By:* {message_data.username}",
-            f"*Time:* {message_data.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+            f"*Time:* {format_timestamp(message_data.timestamp)}"
         ]
 
         if 'src_url_defanged' in message_data.metadata:
@@ -20,24 +20,38 @@ Telegram API Details:
 """
 import asyncio
 import os
+import shutil
+import tempfile
 import time
+from collections import OrderedDict
 from html import escape
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from telethon import TelegramClient, events, utils
 from telethon.errors import FloodWaitError
 from telethon.tl.types import (
-    MessageMediaPhoto, MessageMediaDocument, Channel, User,
+    MessageMediaPhoto, MessageMediaDocument, Channel,
     DocumentAttributeVideo, DocumentAttributeAudio
 )
 from ConfigManager import ConfigManager
 from MessageData import MessageData
-from DestinationHandler import DestinationHandler
+from DestinationHandler import DestinationHandler, format_timestamp
 from LoggerSetup import setup_logger
 from AllowedFileTypes import ALLOWED_EXTENSIONS, ALLOWED_MIME_TYPES
 from AppTypes import APP_TYPE_TELEGRAM
 
 _logger = setup_logger(__name__)
 
+# Telethon media and document attribute types are leaf classes, so an exact
+# type() lookup is equivalent to the isinstance checks it replaces
+_MEDIA_TYPE_NAMES = {
+    MessageMediaPhoto: "Photo",
+    MessageMediaDocument: "Document",
+}
+_DOCUMENT_ATTRIBUTE_TYPE_NAMES = {
+    DocumentAttributeVideo: "Video",
+    DocumentAttributeAudio: "Audio",
+}
+
 class TelegramHandler(DestinationHandler):
     """Telegram handler for message monitoring and delivery.
 
@@ -54,6 +68,8 @@ class TelegramHandler(DestinationHandler):
     _FILE_SIZE_LIMIT = 2 * 1024 * 1024 * 1024  # 2GB
 
     _DEFAULT_POLL_INTERVAL = 300  # seconds
+    _MAX_CONCURRENT_FETCHES = 8
+    _REPLY_CACHE_SIZE = 256
 
     def __init__(self, config: ConfigManager, metrics=None):
         """Initialize TelegramHandler with configuration.
@@ -77,6 +93,15 @@ class TelegramHandler(DestinationHandler):
         # Destination resolution cache: spec (@name or -100id) -> int chat_id
         self._dest_cache: Dict[str, int] = {}
 
+        # Entity resolution cache: identifier as configured -> Telegram entity
+        self._entity_cache: Dict[str, object] = {}
+
+        # Caps concurrent attachment downloads (created on first use inside the event loop)
+        self._download_semaphore: Optional[asyncio.Semaphore] = None
+
+        # LRU of reply contexts: (chat_id, reply_to_msg_id) -> context dict
+        self._reply_cache: "OrderedDict[Tuple[int, int], Dict]" = OrderedDict()
+
     @property
     def file_size_limit(self) -> int:
         """Maximum file size in bytes for Telegram."""
@@ -89,6 +114,9 @@ class TelegramHandler(DestinationHandler):
         channel IDs from config into Telegram entities. Stores resolved entities
         in self.channels for message monitoring. Logs success/failure for each channel.
         """
+        # Before start(): get_me() leaves the session connection inside a transaction,
+        # where SQLite ignores journal_mode and rejects synchronous changes
+        self._tune_session_storage()
         await self.client.start()
         _logger.info("Telegram client started")
 
@@ -99,11 +127,41 @@ class TelegramHandler(DestinationHandler):
                 self.channels[entity_id] = telegram_entity
                 name = f"@{telegram_entity.username}" if getattr(telegram_entity, 'username', None) else telegram_entity.title
                 self.config.channel_names[entity_id] = name
-                _logger.info(f"Resolved {channel_id} -> ID: {entity_id}, Name: {name}")
+                _logger.info("Resolved %s -> ID: %s, Name: %s", channel_id, entity_id, name)
             except Exception as e:
                 _logger.error(f"Failed to resolve {channel_id}: {e}")
 
-        _logger.info(f"Resolved {len(self.channels)} channels")
+        _logger.info("Resolved %d channels", len(self.channels))
+
+    def _tune_session_storage(self) -> None:
+        """Switch the SQLite session file to WAL journaling with relaxed syncing.
+
+        Telethon writes update state to the session database as messages arrive. WAL with
+        synchronous=NORMAL avoids an fsync on every such write while keeping the file
+        consistent after a crash. synchronous is only relaxed once SQLite confirms WAL
+        mode, since NORMAL with a rollback journal is not crash safe. Must run before
+        client.start(). Skipped if the session isn't SQLite backed.
+        """
+        session = self.client.session
+        get_cursor = getattr(session, '_cursor', None)
+        if get_cursor is None:
+            return
+
+        try:
+            # Commit anything pending so the pragmas aren't issued inside a transaction
+            session.save()
+            cursor = get_cursor()
+            try:
+                row = cursor.execute("PRAGMA journal_mode=WAL").fetchone()
+                journal_mode = str(row[0]).lower() if row else None
+                if journal_mode != 'wal':
+                    _logger.warning(f"Session storage stayed in journal_mode={journal_mode}, leaving synchronous unchanged")
+                    return
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            finally:
+                cursor.close()
+        except Exception as e:
+            _logger.warning(f"Could not tune session storage: {e}")
 
     async def _resolve_entity(self, identifier: str):
         """Shared entity resolution logic for channels and destinations.
@@ -114,6 +172,9 @@ class TelegramHandler(DestinationHandler):
         - xxx: Bare numeric ID
         - username: Bare username (adds @ prefix automatically)
 
+        Resolved entities are cached per identifier, so a channel used as both a
+        source and a destination is only looked up once.
+
         Args:
             identifier: Channel identifier in any supported format
 
@@ -123,14 +184,21 @@ class TelegramHandler(DestinationHandler):
         Raises:
             Exception: If entity cannot be resolved
         """
+        cached = self._entity_cache.get(identifier)
+        if cached is not None:
+            return cached
+
         if identifier.startswith('@'):
-            return await self.client.get_entity(identifier)
+            telegram_entity = await self.client.get_entity(identifier)
         elif identifier.startswith('-100'):
-            return await self.client.get_entity(int(identifier))
+            telegram_entity = await self.client.get_entity(int(identifier))
         elif identifier.lstrip('-').isdigit():
-            return await self.client.get_entity(int(identifier))
+            telegram_entity = await self.client.get_entity(int(identifier))
         else:
-            return await self.client.get_entity(f"@{identifier}")
+            telegram_entity = await self.client.get_entity(f"@{identifier}")
+
+        self._entity_cache[identifier] = telegram_entity
+        return telegram_entity
 
     def _get_channel_name(self, channel_id: str) -> str:
         """Get friendly channel name, or 'Unresolved:ID' if unknown.
@@ -147,7 +215,9 @@ class TelegramHandler(DestinationHandler):
             >>> handler._get_channel_name("-100123456789")
             "Unresolved:-100123456789"  # If not resolved yet
         """
-        return self.config.channel_names.get(channel_id, f"Unresolved:{channel_id}")
+        name = self.config.channel_names.get(channel_id)
+        # Only format the fallback when the lookup misses
+        return name if name is not None else f"Unresolved:{channel_id}"
 
     def _telegram_log_path(self, channel_id: str):
         """Get path to telegram log file for a channel.
@@ -199,7 +269,7 @@ class TelegramHandler(DestinationHandler):
 
         content = f"{channel_name}\n{msg_id}\n"
         log_path.write_text(content, encoding='utf-8')
-        _logger.info(f"Created log for {channel_name}: msg_id={msg_id}")
+        _logger.info("Created log for %s: msg_id=%s", channel_name, msg_id)
 
     def _read_telegram_log(self, channel_id: str) -> Optional[int]:
         """Read last processed message ID from telegram log.
@@ -232,7 +302,7 @@ class TelegramHandler(DestinationHandler):
             _logger.error(f"Error reading log for {channel_id}: {e}")
         return None
 
-    def _update_telegram_log(self, channel_id: str, msg_id: int) -> None:
+    def _update_telegram_log(self, channel_id: str, msg_id: int, channel_name: Optional[str] = None) -> None:
         """Update telegram log with new message ID.
 
         Overwrites the log file with updated message ID while preserving
@@ -244,16 +314,18 @@ class TelegramHandler(DestinationHandler):
         Args:
             channel_id: Channel ID to update log for
             msg_id: New message ID to record
+            channel_name: Channel name if the caller already looked it up
 
         Returns:
             None
         """
         log_path = self._telegram_log_path(channel_id)
-        channel_name = self._get_channel_name(channel_id)
+        if channel_name is None:
+            channel_name = self._get_channel_name(channel_id)
 
         content = f"{channel_name}\n{msg_id}\n"
         log_path.write_text(content, encoding='utf-8')
-        _logger.debug(f"Updated log for {channel_name}: msg_id={msg_id}")
+        _logger.debug("Updated log for %s: msg_id=%s", channel_name, msg_id)
 
     async def fetch_latest_messages(self):
         """Fetch latest message from each channel for connection proof.
@@ -264,21 +336,32 @@ class TelegramHandler(DestinationHandler):
 
         Also creates Telegram log files with the latest message ID for each channel,
         enabling missed message detection during polling.
+
+        Channels are fetched concurrently, capped at _MAX_CONCURRENT_FETCHES to stay
+        clear of Telegram flood limits.
         """
-        for channel_id, telegram_entity in self.channels.items():
+        fetch_semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FETCHES)
+
+        async def fetch_latest(channel_id: str, telegram_entity) -> None:
             channel_name = self._get_channel_name(channel_id)
             try:
-                async for message in self.client.iter_messages(telegram_entity, limit=1):
-                    if message:
-                        self._create_telegram_log(channel_id, message.id)
-
-                        if self.msg_callback:
-                            message_data = await self._create_message_data(message, channel_id)
-                            await self.msg_callback(message_data, is_latest=True)
-                    break
+                async with fetch_semaphore:
+                    async for message in self.client.iter_messages(telegram_entity, limit=1):
+                        if message:
+                            self._create_telegram_log(channel_id, message.id)
+
+                            if self.msg_callback:
+                                message_data = await self._create_message_data(message, channel_id, channel_name)
+                                await self.msg_callback(message_data, is_latest=True)
+                        break
             except Exception as e:
                 _logger.error(f"Error fetching from {channel_name}: {e}")
 
+        await asyncio.gather(*(
+            fetch_latest(channel_id, telegram_entity)
+            for channel_id, telegram_entity in self.channels.items()
+        ))
+
     async def poll_missed_messages(self):
         """Poll for messages that may have been missed during downtime.
 
@@ -336,27 +419,22 @@ class TelegramHandler(DestinationHandler):
                             messages_to_process.reverse()
 
                             for message in messages_to_process:
-                                _logger.info(
-                                    f"Processing missed message: "
-                                    f"{channel_name} msg_id={message.id}"
-                                )
-
                                 if self.msg_callback:
-                                    message_data = await self._create_message_data(message, channel_id)
+                                    message_data = await self._create_message_data(message, channel_id, channel_name)
                                     await self.msg_callback(message_data, is_latest=False)
 
                             # Update log with the newest message ID
-                            self._update_telegram_log(channel_id, newest_msg_id)
+                            self._update_telegram_log(channel_id, newest_msg_id, channel_name)
 
                             missed_count = len(messages_to_process)
                             if self._metrics:
                                 self._metrics.increment("messages_first_missed_telegram", missed_count)
                             _logger.info(
-                                f"Processed {missed_count} missed messages "
-                                f"from {channel_name} (newest_id={newest_msg_id})"
+                                "Processed %d missed messages from %s (msg_ids=%s..%s)",
+                                missed_count, channel_name, messages_to_process[0].id, newest_msg_id
                             )
 
-                        _logger.info(f"{channel_name} polled; missed={missed_count}")
+                        _logger.info("%s polled; missed=%d", channel_name, missed_count)
 
                     except Exception as e:
                         _logger.error(f"Error polling {channel_name}: {e}")
@@ -376,11 +454,21 @@ class TelegramHandler(DestinationHandler):
         self.msg_callback = callback
 
         configured_unique = len(self.config.get_all_channel_ids())
-        _logger.info(f"Channels in configuration: {configured_unique}")
+        _logger.info("Channels in configuration: %s", configured_unique)
         resolved_count = len(self.channels)
-        _logger.info(f"Channels successfully resolved: {resolved_count}")
+        _logger.info("Channels successfully resolved: %s", resolved_count)
+
+        # Filter on the entities resolved in start() so Telethon drops updates from
+        # unmonitored chats before calling the handler. Numeric IDs that failed to
+        # resolve are kept as ints so their updates still arrive (no filter if empty)
+        chats = list(self.channels.values())
+        chats.extend(
+            int(channel_id)
+            for channel_id in self.config.get_all_channel_ids()
+            if channel_id not in self._entity_cache and channel_id.lstrip('-').isdigit()
+        )
 
-        @self.client.on(events.NewMessage())
+        @self.client.on(events.NewMessage(chats=chats or None))
         async def handle_message(event):
             try:
                 channel_id = str(event.chat_id)
@@ -390,24 +478,24 @@ class TelegramHandler(DestinationHandler):
                 # Skip if already processed by polling mechanism
                 last_processed_id = self._read_telegram_log(channel_id)
                 if last_processed_id is not None and telegram_msg_id <= last_processed_id:
-                    _logger.debug(f"Skipping duplicate: {channel_name} msg_id={telegram_msg_id}")
+                    _logger.debug("Skipping duplicate: %s msg_id=%s", channel_name, telegram_msg_id)
                     return
 
                 # Update telegram log before creating message_data to prevent race condition with polling
                 if telegram_msg_id:
-                    self._update_telegram_log(channel_id, telegram_msg_id)
+                    self._update_telegram_log(channel_id, telegram_msg_id, channel_name)
 
-                _logger.debug(f"Received message tg_id={telegram_msg_id} from {channel_name}")
+                _logger.debug("Received message tg_id=%s from %s", telegram_msg_id, channel_name)
 
                 # Create message_data and route
-                message_data = await self._create_message_data(event.message, channel_id)
+                message_data = await self._create_message_data(event.message, channel_id, channel_name)
                 await callback(message_data, is_latest=False)
 
             except Exception as e:
                 channel_name = self._get_channel_name(str(event.chat_id))
                 _logger.error(f"Error handling message from {channel_name}: {e}", exc_info=True)
 
-    async def _create_message_data(self, message, channel_id: str) -> MessageData:
+    async def _create_message_data(self, message, channel_id: str, channel_name: Optional[str] = None) -> MessageData:
         """Create MessageData from Telegram message.
 
         Extracts all relevant information from Telegram message and converts
@@ -416,11 +504,14 @@ class TelegramHandler(DestinationHandler):
         Args:
             message: Telethon Message object
             channel_id: Source channel numeric ID
+            channel_name: Channel name if the caller already looked it up
 
         Returns:
             MessageData: Standardized message container
         """
         self._msg_counter += 1
+        if channel_name is None:
+            channel_name = self._get_channel_name(channel_id)
 
         username = self._extract_username_from_sender(message.sender)
         attachment_type = self._get_attachment_type(message.media)
@@ -432,7 +523,7 @@ class TelegramHandler(DestinationHandler):
         return MessageData(
             source_type=APP_TYPE_TELEGRAM,
             channel_id=channel_id,
-            channel_name=self._get_channel_name(channel_id),
+            channel_name=channel_name,
             username=username,
             timestamp=message.date,
             text=message.text or "",
@@ -458,18 +549,20 @@ class TelegramHandler(DestinationHandler):
         if not sender:
             return "Unknown"
 
-        if isinstance(sender, User):
-            if sender.username:
-                return f"@{sender.username}"
-            elif sender.first_name:
-                username = sender.first_name
-                if sender.last_name:
-                    username += f" {sender.last_name}"
-                return username
-        elif isinstance(sender, Channel):
-            return f"@{sender.username}" if sender.username else "Channel"
+        # Single getattr per field covers User, Channel, and Chat senders alike
+        username = getattr(sender, 'username', None)
+        if username:
+            return f"@{username}"
+
+        first_name = getattr(sender, 'first_name', None)
+        if first_name:
+            last_name = getattr(sender, 'last_name', None)
+            return f"{first_name} {last_name}" if last_name else first_name
+
+        if isinstance(sender, Channel):
+            return "Channel"
 
-        return f"@{getattr(sender, 'username', 'Unknown')}"
+        return "Unknown"
 
     @staticmethod
     def _get_attachment_type(media) -> Optional[str]:
@@ -484,30 +577,23 @@ class TelegramHandler(DestinationHandler):
         if not media:
             return None
 
-        if isinstance(media, MessageMediaPhoto):
-            return "Photo"
-        elif isinstance(media, MessageMediaDocument):
+        media_type = _MEDIA_TYPE_NAMES.get(type(media), "Other")
+        if media_type == "Document":
             # Check document attributes to determine specific type
-            doc = media.document
-            if not doc or not hasattr(doc, 'attributes'):
-                return "Document"
-
-            for attr in doc.attributes:
-                if isinstance(attr, DocumentAttributeVideo):
-                    return "Video"
-                elif isinstance(attr, DocumentAttributeAudio):
-                    return "Audio"
-
-            # If no specific attributes found, it's a generic document/file
-            return "Document"
-        else:
-            return "Other"
+            for attr in getattr(media.document, 'attributes', None) or ():
+                attr_type = _DOCUMENT_ATTRIBUTE_TYPE_NAMES.get(type(attr))
+                if attr_type:
+                    return attr_type
+
+        # If no specific attributes found, a document is a generic document/file
+        return media_type
 
     async def _get_reply_context(self, message) -> Optional[Dict]:
         """Extract context about the message this is replying to.
 
         Fetches the original message being replied to and extracts relevant
-        metadata for display in forwarded messages.
+        metadata for display in forwarded messages. Results are kept in a
+        bounded LRU cache so replies quoting the same message are fetched once.
 
         Args:
             message: Telegram message object with reply_to field
@@ -517,6 +603,13 @@ class TelegramHandler(DestinationHandler):
                           attachment_type, has_attachments. None if reply fetch fails.
         """
         try:
+            # Inside the try: story replies have no reply_to_msg_id
+            cache_key = (message.chat_id, message.reply_to.reply_to_msg_id)
+            cached = self._reply_cache.get(cache_key)
+            if cached is not None:
+                self._reply_cache.move_to_end(cache_key)
+                return dict(cached)
+
             replied_msg = await self.client.get_messages(
                 message.chat_id,
                 ids=message.reply_to.reply_to_msg_id
@@ -530,11 +623,15 @@ class TelegramHandler(DestinationHandler):
                     'message_id': replied_msg.id,
                     'author': author,
                     'text': replied_msg.text or "",
-                    'time': replied_msg.date.strftime('%Y-%m-%d %H:%M:%S UTC') if replied_msg.date else "",
+                    'time': format_timestamp(replied_msg.date) if replied_msg.date else "",
                     'attachment_type': attachment_type,
                     'has_attachments': bool(attachment_type)
                 }
-                return context
+
+                self._reply_cache[cache_key] = context
+                if len(self._reply_cache) > self._REPLY_CACHE_SIZE:
+                    self._reply_cache.popitem(last=False)
+                return dict(context)
 
         except Exception as e:
             _logger.error(f"Error getting reply context: {e}", exc_info=True)
@@ -566,27 +663,32 @@ class TelegramHandler(DestinationHandler):
             return True 
 
         document = message.media.document
-        extension_allowed = False
-        mime_allowed = False
+        allowed = False
         file_extension = None
         mime_type = getattr(document, "mime_type", None)
 
-        if hasattr(document, 'attributes'):
-            for attr in document.attributes:
-                if hasattr(attr, 'file_name') and attr.file_name:
-                    file_extension = os.path.splitext(attr.file_name.lower())[1]
+        # MIME type is the cheaper check, only scan the attributes for the extension if it passes
+        if mime_type in ALLOWED_MIME_TYPES:
+            for attr in getattr(document, 'attributes', ()):
+                file_name = getattr(attr, 'file_name', None)
+                if file_name:
+                    file_extension = os.path.splitext(file_name.lower())[1]
                     if file_extension in ALLOWED_EXTENSIONS:
-                        extension_allowed = True
+                        allowed = True
                         break
 
-        if mime_type and mime_type in ALLOWED_MIME_TYPES:
-            mime_allowed = True
-
-        allowed = extension_allowed and mime_allowed
         if not allowed:
+            if file_extension is None:
+                # Attributes weren't scanned when the MIME check failed; find the extension for the log
+                file_extension = next(
+                    (os.path.splitext(file_name.lower())[1]
+                     for file_name in (getattr(attr, 'file_name', None) for attr in getattr(document, 'attributes', ()))
+                     if file_name),
+                    None
+                )
             _logger.info(
-                f"Attachment blocked by restricted mode: "
-                f"type={type(message.media).__name__}, ext={file_extension}, mime={mime_type}"
+                "Attachment blocked by restricted mode: type=%s, ext=%s, mime=%s",
+                type(message.media).__name__, file_extension, mime_type
             )
         
         # Return True if restricted (not allowed), False if allowed
@@ -595,26 +697,45 @@ class TelegramHandler(DestinationHandler):
     async def download_attachment(self, message_data: MessageData) -> Optional[str]:
         """Download attached file from message.
 
+        At most config.max_concurrent_downloads downloads run at once and each is abandoned
+        after config.download_timeout seconds so a stalled transfer can't hold up routing.
+        Each download gets its own directory under attachments_dir, so the partial file
+        of an abandoned or failed download can be removed.
+
         Args:
             message_data: MessageData object containing the original Telegram message with attachment.
 
         Returns:
             Optional[str]: Path to the downloaded attachment file if successful, None otherwise.
         """
+        download_dir = None
         try:
             if message_data.original_message and message_data.original_message.media:
-                target_dir = str(self.config.attachments_dir) + os.sep
-                attachment_path = await message_data.original_message.download_media(file=target_dir)
+                if self._download_semaphore is None:
+                    self._download_semaphore = asyncio.Semaphore(self.config.max_concurrent_downloads)
+
+                download_dir = await asyncio.to_thread(tempfile.mkdtemp, dir=self.config.attachments_dir)
+                async with self._download_semaphore:
+                    attachment_path = await asyncio.wait_for(
+                        message_data.original_message.download_media(file=download_dir + os.sep),
+                        timeout=self.config.download_timeout or None
+                    )
                 if attachment_path:
-                    file_size = os.path.getsize(attachment_path)
+                    file_size = await asyncio.to_thread(os.path.getsize, attachment_path)
                     file_size_mb = file_size / (1024 * 1024)
                     _logger.info(
-                        f"Attachment downloaded successfully: "
-                        f"{os.path.basename(attachment_path)} ({file_size_mb:.2f} MB)"
+                        "Attachment downloaded successfully: %s (%.2f MB)",
+                        os.path.basename(attachment_path), file_size_mb
                     )
-                return attachment_path
+                    return attachment_path
+        except asyncio.TimeoutError:
+            _logger.error(f"Attachment download timed out after {self.config.download_timeout}s")
         except Exception as e:
             _logger.error(f"Attachment download failed: {e}")
+
+        # Remove the partial file of a timed out or failed download
+        if download_dir:
+            await asyncio.to_thread(shutil.rmtree, download_dir, ignore_errors=True)
         return None
 
     @staticmethod
@@ -736,22 +857,21 @@ class TelegramHandler(DestinationHandler):
             if self.is_rate_limited(destination_chat_id):
                 wait_until = self._rate_limits[destination_chat_id]
                 wait_time = wait_until - time.time()
-                _logger.info(f"Destination {destination_chat_id} is rate limited for {wait_time:.1f}s, skipping send")
+                _logger.info("Destination %s is rate limited for %.1fs, skipping send", destination_chat_id, wait_time)
                 return False
 
             # Attachment with content
-            if attachment_path and os.path.exists(attachment_path):
+            if attachment_path and await asyncio.to_thread(os.path.exists, attachment_path):
                 if len(content) <= self.MAX_CAPTION_LENGTH:
                     # Content fits as caption, send attachment with caption
                     await self.client.send_file(destination_chat_id, attachment_path,
                                               caption=content or None, parse_mode='html')
                 else:
                     # Content too long for caption, send attachment captionless then chunk content at 4096
-                    _logger.info(f"Content exceeds {self.MAX_CAPTION_LENGTH} chars, sending attachment captionless and text separately")
+                    _logger.info("Content exceeds %d chars, sending attachment captionless and text separately", self.MAX_CAPTION_LENGTH)
                     await self.client.send_file(destination_chat_id, attachment_path, caption=None)
 
-                    chunks = self._chunk_text(content, self.MAX_MSG_LENGTH)
-                    for chunk in chunks:
+                    for chunk in self._iter_chunks(content, self.MAX_MSG_LENGTH):
                         await self.client.send_message(destination_chat_id, chunk, parse_mode='html')
                 return True
 
@@ -759,8 +879,7 @@ class TelegramHandler(DestinationHandler):
             if len(content) <= self.MAX_MSG_LENGTH:
                 await self.client.send_message(destination_chat_id, content, parse_mode='html')
             else:
-                chunks = self._chunk_text(content, self.MAX_MSG_LENGTH)
-                for chunk in chunks:
+                for chunk in self._iter_chunks(content, self.MAX_MSG_LENGTH):
                     await self.client.send_message(destination_chat_id, chunk, parse_mode='html')
             return True
 
@@ -787,7 +906,7 @@ class TelegramHandler(DestinationHandler):
         lines = [
             f"<b>New message from:</b> {escape(message_data.channel_name)}",
             f"<b>By:</b> {escape(message_data.username)}",
-            f"<b>Time:</b> {message_data.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+            f"<b>Time:</b> {format_timestamp(message_data.timestamp)}"
         ]
 
         if 'src_url_defanged' in message_data.metadata:
@@ -16,8 +16,10 @@ Subcommands:
 from __future__ import annotations
 import os
 import argparse
+import shutil
 import asyncio
 import json
+import logging
 import time
 from typing import List, Dict, Optional, TYPE_CHECKING
 from pathlib import Path
@@ -26,10 +28,17 @@ from Discover import discover_channels
 from AppTypes import APP_TYPE_TELEGRAM, APP_TYPE_DISCORD, APP_TYPE_SLACK, APP_TYPE_RSS
 from AllowedFileTypes import ALLOWED_EXTENSIONS
 from SendStatus import SendStatus
+from DestinationHandler import format_timestamp
 
 if TYPE_CHECKING:
     from MessageData import MessageData
 
+try:
+    import uvloop
+    _UVLOOP_AVAILABLE = True
+except Exception:
+    _UVLOOP_AVAILABLE = False
+
 _logger = setup_logger(__name__)
 
 class Watchtower:
@@ -120,10 +129,14 @@ class Watchtower:
                     try:
                         if file_path.is_file():
                             os.remove(file_path)
-                            _logger.info(f"Cleaned up leftover file: {file_path}")
+                            _logger.info("Cleaned up leftover file: %s", file_path)
+                        elif file_path.is_dir():
+                            # Per-download directory left by a Telegram attachment download
+                            shutil.rmtree(file_path)
+                            _logger.info("Cleaned up leftover download directory: %s", file_path)
                     except Exception as e:
                         _logger.warning(f"Failed to clean up {file_path}: {e}")
-                _logger.info(f"Cleaned up {len(files)} leftover media files from attachments directory")
+                _logger.info("Cleaned up %d leftover media files from attachments directory", len(files))
 
     async def start(self) -> None:
         """Start the Watchtower service.
@@ -160,7 +173,7 @@ class Watchtower:
             for feed in self.config.rss_feeds:
                 tasks.append(asyncio.create_task(self.rss.run_feed(feed)))
 
-        _logger.info(f"Now monitoring for new messages... (sources={','.join(self.sources)})")
+        _logger.info("Now monitoring for new messages... (sources=%s)", ','.join(self.sources))
 
         if tasks:
             try:
@@ -188,8 +201,8 @@ class Watchtower:
         metrics_summary = self.metrics.get_all()
         if metrics_summary:
             _logger.info(
-                f"Final metrics for this session:\n"
-                f"{json.dumps(metrics_summary, indent=2)}"
+                "Final metrics for this session:\n%s",
+                json.dumps(metrics_summary, indent=2)
             )
 
         queue_size = self.message_queue.get_queue_size()
@@ -221,7 +234,7 @@ class Watchtower:
                 for log_file in telegramlog_dir.glob("*.txt"):
                     log_file.unlink()
                     count += 1
-                _logger.info(f"Cleared {count} telegram log file(s)")
+                _logger.info("Cleared %d telegram log file(s)", count)
         except Exception as e:
             _logger.error(f"Error clearing telegram logs: {e}")
 
@@ -249,10 +262,13 @@ class Watchtower:
             # Connection proof logging
             if is_latest:
                 _logger.info(
-                    f"\nCONNECTION ESTABLISHED\n"
-                    f"  Channel: {message_data.channel_name}\n"
-                    f"  Latest message by: {message_data.username}\n"
-                    f"  Time: {message_data.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+                    "\nCONNECTION ESTABLISHED\n"
+                    "  Channel: %s\n"
+                    "  Latest message by: %s\n"
+                    "  Time: %s\n",
+                    message_data.channel_name,
+                    message_data.username,
+                    format_timestamp(message_data.timestamp)
                 )
                 return False
 
@@ -263,18 +279,28 @@ class Watchtower:
 
             destinations = self.router.get_destinations(message_data)
             if not destinations:
-                _logger.info(f"Message from {message_data.channel_name} by {message_data.username} has no destinations")
+                _logger.info("Message from %s by %s has no destinations", message_data.channel_name, message_data.username)
                 self.metrics.increment("total_msgs_no_destination")
                 return False
 
             attachment_passes_restrictions = await self._handle_attachment_restrictions(message_data, destinations)
 
             success_count = 0
+            outcomes = []
             for destination in destinations:
-                success = await self._dispatch_to_destination(message_data, destination, attachment_passes_restrictions)
-                if success:
+                status = await self._dispatch_to_destination(message_data, destination, attachment_passes_restrictions)
+                outcomes.append((status, destination['name']))
+                if status == SendStatus.SENT:
                     success_count += 1
 
+            # One record per message instead of one per destination, built only if it will be emitted
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info(
+                    "Message from %s by %s %s",
+                    message_data.channel_name, message_data.username,
+                    ", ".join(f"{status.value} to {name}" for status, name in outcomes)
+                )
+
             if success_count > 0:
                 self.metrics.increment("total_msgs_routed_success")
             else:
@@ -288,10 +314,15 @@ class Watchtower:
 
         finally:
             # Clean up stored attachments after all destinations have been processed
-            if message_data.attachment_path and os.path.exists(message_data.attachment_path):
+            if message_data.attachment_path:
                 try:
-                    os.remove(message_data.attachment_path)
-                    _logger.debug(f"Cleaned up stored attachment file: {message_data.attachment_path}")
+                    # Single unlink syscall, run off the event loop for slow disks
+                    attachment = Path(message_data.attachment_path)
+                    await asyncio.to_thread(attachment.unlink, missing_ok=True)
+                    # Telegram downloads sit in their own directory under attachments_dir
+                    if attachment.parent.parent == self.config.attachments_dir:
+                        await asyncio.to_thread(attachment.parent.rmdir)
+                    _logger.debug("Cleaned up stored attachment file: %s", message_data.attachment_path)
                 except Exception as e:
                     _logger.error(f"Error removing stored attachment file at {message_data.attachment_path}: {e}")
 
@@ -307,7 +338,7 @@ class Watchtower:
         if ocr_needed and self.ocr.is_available():
             if not message_data.attachment_path:
                 message_data.attachment_path = await self.telegram.download_attachment(message_data)
-            if message_data.attachment_path and os.path.exists(message_data.attachment_path):
+            if message_data.attachment_path and await asyncio.to_thread(os.path.exists, message_data.attachment_path):
                 # Only attempt OCR on image files
                 if self._is_image_file(message_data.attachment_path):
                     ocr_text = self.ocr.extract_text(message_data.attachment_path)
@@ -316,7 +347,7 @@ class Watchtower:
                         message_data.ocr_raw = ocr_text
                         self.metrics.increment("ocr_msgs_processed")
                 else:
-                    _logger.debug(f"Skipping OCR for non-image file: {message_data.attachment_path}")
+                    _logger.debug("Skipping OCR for non-image file: %s", message_data.attachment_path)
 
         if message_data.source_type == APP_TYPE_TELEGRAM and message_data.original_message:
             telegram_msg_id = getattr(message_data.original_message, "id", None)
@@ -377,7 +408,7 @@ class Watchtower:
 
         return attachment_passes_restrictions
 
-    async def _dispatch_to_destination(self, message_data: MessageData, destination: Dict, attachment_passes_restrictions: bool) -> bool:
+    async def _dispatch_to_destination(self, message_data: MessageData, destination: Dict, attachment_passes_restrictions: bool) -> SendStatus:
         """Dispatch message to a single destination
 
         Applies destination specific parsing, formats the message, determines media inclusion,
@@ -389,7 +420,7 @@ class Watchtower:
             attachment_passes_restrictions: Whether media passed restricted mode checks
 
         Returns:
-            bool: True if sent successfully to at least one destination, False otherwise
+            SendStatus: Outcome of the send (SENT, QUEUED for retry, or FAILED)
         """
         parsed_message = self.router.parse_msg(message_data, destination['parser'])
 
@@ -410,9 +441,7 @@ class Watchtower:
         else:
             status = SendStatus.FAILED
 
-        _logger.info(f"Message from {parsed_message.channel_name} by {parsed_message.username} {status.value} to {destination['name']}")
-
-        return status == SendStatus.SENT
+        return status
 
     async def _send_to_discord(self, parsed_message: MessageData, destination: Dict, content: str, include_attachment: bool) -> SendStatus:
         """Send message to Discord webhook.
@@ -586,15 +615,17 @@ class Watchtower:
             # Stream file line-by-line
             matched_lines = []
             total_lines = 0
+            folded_keywords = [keyword.casefold() for keyword in keywords]
 
             with open(path, 'r', encoding='utf-8', errors='ignore') as f:
                 for line in f:
                     total_lines += 1
                     line_stripped = line.rstrip('\n\r')
 
-                    if keywords:
+                    if folded_keywords:
                         # Check for matches
-                        if any(keyword.lower() in line_stripped.lower() for keyword in keywords):
+                        line_folded = line_stripped.casefold()
+                        if any(keyword in line_folded for keyword in folded_keywords):
                             matched_lines.append(line_stripped)
                     else:
                         # Collect first 100 lines as sample
@@ -651,8 +682,8 @@ class Watchtower:
             # File is too large, extract matched lines or sample
             file_size_mb = file_size / (1024 * 1024)
             _logger.info(
-                f"Attachment {Path(attachment_path).name} ({file_size_mb:.1f}MB) "
-                f"exceeds limit ({file_size_limit / (1024*1024):.1f}MB), using cached data or streaming file for keyword extraction"
+                "Attachment %s (%.1fMB) exceeds limit (%.1fMB), using cached data or streaming file for keyword extraction",
+                Path(attachment_path).name, file_size_mb, file_size_limit / (1024*1024)
             )
 
             keywords = destination.get('keywords', [])
@@ -740,6 +771,22 @@ class Watchtower:
 
         return parsed_message.attachment_path
 
+def _run(coro):
+    """Run a coroutine to completion on a new event loop.
+
+    Uses uvloop's faster loop for the network-bound Telethon/webhook workload when
+    installed, without installing a global event loop policy.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if _UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 def main():
     """Main entry point for Watchtower CLI.
 
@@ -778,20 +825,20 @@ def main():
         app = None
         try:
             app = Watchtower(sources)
-            asyncio.run(app.start())
+            _run(app.start())
         except KeyboardInterrupt:
             _logger.info("Interrupted by user (Ctrl+C)")
             if app:
-                asyncio.run(app.shutdown())
+                _run(app.shutdown())
         except Exception as e:
             _logger.error(f"Error: {e}")
             if app:
-                asyncio.run(app.shutdown())
+                _run(app.shutdown())
             raise
 
     elif args.cmd == "discover":
         try:
-            asyncio.run(discover_channels(diff_mode=args.diff, generate_config=args.generate))
+            _run(discover_channels(diff_mode=args.diff, generate_config=args.generate))
         except KeyboardInterrupt:
             _logger.info("Interrupted by user (Ctrl+C)")
         except Exception as e: